@@ -2,6 +2,8 @@ import logging
 import os
 from argparse import Namespace
 from collections.abc import Callable
+from functools import lru_cache
+from itertools import chain, repeat
 from typing import Any
 
 from miles.rollout.base_types import RolloutFnEvalOutput, RolloutFnTrainOutput
@@ -14,6 +16,18 @@ from miles.utils.types import Sample
 logger = logging.getLogger(__name__)
 
 
+def _batch_tokenize(tokenizer, contents: list[str]) -> list[list[int]]:
+    if not contents:
+        return []
+    return tokenizer(contents, add_special_tokens=False, return_attention_mask=False)["input_ids"]
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_prompt_contents(tokenizer, contents: tuple[str, ...]) -> tuple[int, ...]:
+    # The system + task prompt is shared by every sample of a group, so most calls are cache hits.
+    return tuple(token for tokens in _batch_tokenize(tokenizer, list(contents)) for token in tokens)
+
+
 def build_tokens_and_mask_from_messages(
     messages: list[dict],
     tokenizer,
@@ -23,31 +37,24 @@ def build_tokens_and_mask_from_messages(
         return [], [], "", 0
 
     prompt_msgs = messages[:2]
-    response_msgs = messages[2:]
+    response_msgs = [msg for msg in messages[2:] if msg.get("content", "")]
 
-    prompt_tokens = []
-    for msg in prompt_msgs:
-        content = msg.get("content", "")
-        if content:
-            prompt_tokens.extend(tokenizer(content, add_special_tokens=False)["input_ids"])
+    prompt_contents = tuple(msg.get("content", "") for msg in prompt_msgs if msg.get("content", ""))
+    prompt_tokens = list(_tokenize_prompt_contents(tokenizer, prompt_contents))
+
+    # Tokenize all response messages in one batched call instead of one call per message.
+    encodings = _batch_tokenize(tokenizer, [msg["content"] for msg in response_msgs])
 
     response_tokens = []
     loss_mask = []
     response_text_parts = []
 
-    for msg in response_msgs:
-        content = msg.get("content", "")
-        if not content:
-            continue
-
-        tokens = tokenizer(content, add_special_tokens=False)["input_ids"]
-        token_len = len(tokens)
-
+    for msg, tokens in zip(response_msgs, encodings, strict=True):
         response_tokens.extend(tokens)
-        response_text_parts.append(content)
+        response_text_parts.append(msg["content"])
 
         mask_val = 1 if msg.get("role") == "assistant" else 0
-        loss_mask.extend([mask_val] * token_len)
+        loss_mask.extend(repeat(mask_val, len(tokens)))
 
     all_tokens = prompt_tokens + response_tokens
     response_text = "".join(response_text_parts)
@@ -191,13 +198,11 @@ async def generate_rollout_async(
 
     rollout_output, aborted_samples = await base_generate_rollout_async(args, rollout_id, data_source)
 
-    all_samples = []
-    for group in rollout_output.samples:
-        if isinstance(group[0], list):
-            for sample_list in group:
-                all_samples.extend(sample_list)
-        else:
-            all_samples.extend(group)
+    # Groups are either list[Sample] or list[list[Sample]]; decide once from the first non-empty group.
+    first_group = next((group for group in rollout_output.samples if group), None)
+    all_samples = list(chain.from_iterable(rollout_output.samples))
+    if first_group is not None and isinstance(first_group[0], list):
+        all_samples = list(chain.from_iterable(all_samples))
 
     agent_metrics = aggregate_agent_metrics(all_samples)
 
@@ -57,13 +57,21 @@ For each function call, return a json object with function name and arguments wi
 <|im_start|>assistant
 """
 
+# Compiled once; building a jinja2 Template parses and compiles the source each time.
+COMPILED_TOOL_TEMPLATE = Template(TOOL_TEMPLATE)
+
+# Patterns used on every model turn, compiled once at import time.
+BOXED_RE = re.compile(r"\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}", re.DOTALL)
+ANSWER_BOXED_RE = re.compile(r"Answer:\s*\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}", re.DOTALL)
+TOOL_CALL_RE = re.compile(r"<tool_call>\s*(\{.*?\})\s*</tool_call>", re.DOTALL)
+CODE_TAG_RE = re.compile(r"<code>(.*?)</code>", re.DOTALL)
+PYTHON_BLOCK_RE = re.compile(r"```python\s*(.*?)\s*```", re.DOTALL)
+
 
 def format_conversation_with_tools(
     prompt: str, tools: list[dict[str, Any]] = None, system_prompt: str = None, messages: list[dict[str, Any]] = None
 ) -> str:
     """Format conversation using Jinja2 template with tool support"""
-    template = Template(TOOL_TEMPLATE)
-
     # Prepare messages
     messages_to_render = []
 
@@ -89,7 +97,7 @@ def format_conversation_with_tools(
         messages_to_render.extend(messages)
 
     # Render template
-    formatted_text = template.render(messages=messages_to_render, tools=tools or [])
+    formatted_text = COMPILED_TOOL_TEMPLATE.render(messages=messages_to_render, tools=tools or [])
 
     return formatted_text
 
@@ -97,15 +105,13 @@ def format_conversation_with_tools(
 def postprocess_predictions(prediction: str):
     """Extract action and content from prediction string"""
     # Check for bare \boxed{...} (model may omit "Answer:" prefix)
-    boxed_pattern = r"\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}"
-    boxed_match = re.search(boxed_pattern, prediction, re.DOTALL)
+    boxed_match = BOXED_RE.search(prediction)
     if boxed_match:
         content = boxed_match.group(1).strip()
         return "answer", content
 
     # Then check for <tool_call> tags (new format from Jinja2 template)
-    tool_call_pattern = r"<tool_call>\s*(\{.*?\})\s*</tool_call>"
-    tool_call_match = re.search(tool_call_pattern, prediction, re.DOTALL)
+    tool_call_match = TOOL_CALL_RE.search(prediction) if "<tool_call>" in prediction else None
     if tool_call_match:
         try:
             import json
@@ -127,15 +133,13 @@ def postprocess_predictions(prediction: str):
             pass
 
     # Then check for <code> tags
-    code_pattern = r"<code>(.*?)</code>"
-    code_match = re.search(code_pattern, prediction, re.DOTALL)
+    code_match = CODE_TAG_RE.search(prediction) if "<code>" in prediction else None
     if code_match:
         content = code_match.group(1).strip()
         return "code", content
 
     # Finally check for ```python code blocks (lowest priority)
-    python_code_pattern = r"```python\s*(.*?)\s*```"
-    python_code_match = re.search(python_code_pattern, prediction, re.DOTALL)
+    python_code_match = PYTHON_BLOCK_RE.search(prediction) if "```python" in prediction else None
     if python_code_match:
         content = python_code_match.group(1).strip()
         return "code", content
@@ -148,8 +152,7 @@ def postprocess_responses(resp: str) -> str:
     # Handle <tool_call> tags (new format from Jinja2 template)
     if "<tool_call>" in resp:
         # Find the last occurrence of <tool_call>...</tool_call>
-        tool_call_pattern = r"<tool_call>\s*\{.*?\}\s*</tool_call>"
-        matches = list(re.finditer(tool_call_pattern, resp, re.DOTALL))
+        matches = list(TOOL_CALL_RE.finditer(resp))
         if matches:
             last_match = matches[-1]
             return resp[: last_match.end()]
@@ -161,8 +164,7 @@ def postprocess_responses(resp: str) -> str:
     # Handle ```python code blocks
     if "```python" in resp:
         # Find the last occurrence of ```python...```
-        python_pattern = r"```python\s*.*?```"
-        matches = list(re.finditer(python_pattern, resp, re.DOTALL))
+        matches = list(PYTHON_BLOCK_RE.finditer(resp))
         if matches:
             last_match = matches[-1]
             return resp[: last_match.end()]
@@ -170,11 +172,8 @@ def postprocess_responses(resp: str) -> str:
     # Handle Answer: \boxed{...} or bare \boxed{...}
     if "\\boxed{" in resp:
         # Try "Answer: \boxed{...}" first, then bare "\boxed{...}"
-        for pattern in [
-            r"Answer:\s*\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}",
-            r"\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}",
-        ]:
-            matches = list(re.finditer(pattern, resp, re.DOTALL))
+        for pattern in [ANSWER_BOXED_RE, BOXED_RE]:
+            matches = list(pattern.finditer(resp))
             if matches:
                 last_match = matches[-1]
                 return resp[: last_match.end()]
@@ -231,7 +230,10 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
         prompt = format_conversation_with_tools(prompt=sample.prompt, tools=tool_specs)
 
     prompt_tokens_ids = state.tokenizer(prompt, add_special_tokens=False)["input_ids"]
-    response = ""
+    # Accumulate response pieces and running stats so no turn re-scans the whole conversation
+    response_parts = []
+    response_num_chars = 0
+    tools_used = 0
     response_token_ids = []
     loss_masks = []
     tool_call_count = 0  # Track actual tool call rounds
@@ -262,12 +264,10 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
             if wandb.run is not None:
                 # Count available tools (from tool_specs)
                 available_tools = len(tool_specs)
-                # Count tools used in the current response
-                tools_used = response.count("<interpreter>")
 
                 wandb.log(
                     {
-                        "debug/payload_length": len(prompt + response),
+                        "debug/payload_length": len(prompt) + response_num_chars,
                         "debug/available_tools": available_tools,
                         "debug/tools_used": tools_used,
                         "debug/turn": turn,
@@ -296,7 +296,9 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
             cur_response = postprocess_responses(cur_response)
             cur_response_token_ids = state.tokenizer(cur_response, add_special_tokens=False)["input_ids"]
 
-        response += cur_response
+        response_parts.append(cur_response)
+        response_num_chars += len(cur_response)
+        tools_used += cur_response.count("<interpreter>")
         response_token_ids += cur_response_token_ids
         loss_masks += [1] * len(cur_response_token_ids)
 
@@ -315,7 +317,9 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
 
         assert next_obs != "", "Next observation should not be empty."
         obs_tokens_ids = state.tokenizer(next_obs, add_special_tokens=False)["input_ids"]
-        response += next_obs
+        response_parts.append(next_obs)
+        response_num_chars += len(next_obs)
+        tools_used += next_obs.count("<interpreter>")
         response_token_ids += obs_tokens_ids
         loss_masks += [0] * len(obs_tokens_ids)
 
@@ -331,6 +335,8 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
         if tool_call_count >= TOOL_CONFIGS["max_tool_calls"]:
             break
 
+    response = "".join(response_parts)
+
     # Set sample attributes
     sample.tokens = prompt_tokens_ids + response_token_ids
     sample.response_length = len(response_token_ids)
@@ -339,8 +345,8 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
 
     # Store payload information for wandb logging
     sample.payload_text = prompt + response
-    sample.payload_has_system = "<|im_start|>system" in prompt + response
-    sample.payload_has_tools = "# Tools" in prompt + response
+    sample.payload_has_system = "<|im_start|>system" in sample.payload_text
+    sample.payload_has_tools = "# Tools" in sample.payload_text
 
     # Store tool call count for reward calculation
     sample.tool_call_count = tool_call_count
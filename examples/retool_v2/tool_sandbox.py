@@ -6,9 +6,9 @@ import asyncio
 import gc
 import os
 import re
-import subprocess
+import shutil
 import tempfile
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 import psutil
 
@@ -24,6 +24,9 @@ TOOL_CONFIGS = {
     "python_timeout": 120,  # 2 minutes for complex calculations
     "python_memory_limit": "4GB",  # 4GB per Python process
     "python_cpu_limit": 1,
+    "python_max_output_bytes": 64 * 1024,  # per stream; the process is killed once exceeded
+    # Parent directory for per-call sandbox dirs; defaults to tmpfs (/dev/shm) when available
+    "sandbox_root": os.getenv("RETOOL_SANDBOX_ROOT") or ("/dev/shm" if os.path.isdir("/dev/shm") else None),
     # Memory management settings
     "max_memory_usage": 12288,  # 12GB total (75% of 16GB)
     "cleanup_threshold": 6144,  # 6GB
@@ -34,6 +37,46 @@ TOOL_CONFIGS = {
 # Global semaphore for controlling concurrent tool executions
 SEMAPHORE = asyncio.Semaphore(TOOL_CONFIGS["tool_concurrency"])
 
+# Patterns rejected by PythonSandbox._check_code_safety, compiled once at import time
+DANGEROUS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"import\s+os",
+        r"import\s+sys",
+        r"import\s+subprocess",
+        r"import\s+shutil",
+        r"import\s+glob",
+        r"import\s+pathlib",
+        r"__import__",
+        r"eval\s*\(",
+        r"exec\s*\(",
+        r"open\s*\(",
+        r"file\s*\(",
+        r"input\s*\(",
+        r"raw_input\s*\(",
+        r"compile\s*\(",
+        r"execfile\s*\(",
+        r"getattr\s*\(",
+        r"setattr\s*\(",
+        r"delattr\s*\(",
+        r"hasattr\s*\(",
+        r"globals\s*\(",
+        r"locals\s*\(",
+        r"vars\s*\(",
+        r"dir\s*\(",
+        r"type\s*\(",
+        r"isinstance\s*\(",
+        r"issubclass\s*\(",
+        r"super\s*\(",
+        r"property\s*\(",
+        r"staticmethod\s*\(",
+        r"classmethod\s*\(",
+        r"__\w+__",  # double underscore methods
+    )
+]
+IMPORT_RE = re.compile(r"import\s+(\w+)")
+FROM_RE = re.compile(r"from\s+(\w+)")
+
 
 def get_memory_usage() -> float:
     """Get current memory usage in MB"""
@@ -87,12 +130,18 @@ def check_and_cleanup_memory():
     return None
 
 
+def _write_text(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
 class PythonSandbox:
     """Python code sandbox, provides safe code execution environment"""
 
-    def __init__(self, timeout: int = 10, memory_limit: str = "100MB"):
+    def __init__(self, timeout: int = 10, memory_limit: str = "100MB", max_output_bytes: int = 64 * 1024):
         self.timeout = timeout
         self.memory_limit = memory_limit
+        self.max_output_bytes = max_output_bytes
         self.allowed_modules = {
             "math",
             "random",
@@ -109,50 +158,13 @@ class PythonSandbox:
     def _check_code_safety(self, code: str) -> tuple[bool, str]:
         """Check code safety by scanning for dangerous patterns"""
         # Check for dangerous operations
-        dangerous_patterns = [
-            r"import\s+os",
-            r"import\s+sys",
-            r"import\s+subprocess",
-            r"import\s+shutil",
-            r"import\s+glob",
-            r"import\s+pathlib",
-            r"__import__",
-            r"eval\s*\(",
-            r"exec\s*\(",
-            r"open\s*\(",
-            r"file\s*\(",
-            r"input\s*\(",
-            r"raw_input\s*\(",
-            r"compile\s*\(",
-            r"execfile\s*\(",
-            r"getattr\s*\(",
-            r"setattr\s*\(",
-            r"delattr\s*\(",
-            r"hasattr\s*\(",
-            r"globals\s*\(",
-            r"locals\s*\(",
-            r"vars\s*\(",
-            r"dir\s*\(",
-            r"type\s*\(",
-            r"isinstance\s*\(",
-            r"issubclass\s*\(",
-            r"super\s*\(",
-            r"property\s*\(",
-            r"staticmethod\s*\(",
-            r"classmethod\s*\(",
-            r"__\w+__",  # double underscore methods
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                return False, f"Code contains dangerous pattern: {pattern}"
+        for pattern in DANGEROUS_PATTERNS:
+            if pattern.search(code):
+                return False, f"Code contains dangerous pattern: {pattern.pattern}"
 
         # Check imported modules
-        import_pattern = r"import\s+(\w+)"
-        from_pattern = r"from\s+(\w+)"
-
-        imports = re.findall(import_pattern, code)
-        froms = re.findall(from_pattern, code)
+        imports = IMPORT_RE.findall(code)
+        froms = FROM_RE.findall(code)
 
         all_imports = set(imports + froms)
         for imp in all_imports:
@@ -161,11 +173,13 @@ class PythonSandbox:
 
         return True, "Code is safe"
 
-    @contextmanager
-    def _create_safe_environment(self):
+    @asynccontextmanager
+    async def _create_safe_environment(self):
         """Create safe execution environment with temporary directory"""
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp(prefix="python_sandbox_")
+        # Create temporary directory (off the event loop, like all sandbox file I/O)
+        temp_dir = await asyncio.to_thread(
+            tempfile.mkdtemp, prefix="python_sandbox_", dir=TOOL_CONFIGS["sandbox_root"]
+        )
 
         try:
             # Create safe Python script
@@ -179,13 +193,30 @@ class PythonSandbox:
             yield script_path, env, temp_dir
 
         finally:
-            # Clean up temporary directory
-            try:
-                import shutil
-
-                shutil.rmtree(temp_dir)
-            except Exception:
-                pass
+            # Clean up temporary directory without blocking other rollouts on the loop
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+
+    async def _communicate_capped(self, process: asyncio.subprocess.Process) -> tuple[str, str, bool]:
+        """Like ``process.communicate()``, but keeps at most ``max_output_bytes`` per stream.
+
+        The process is killed as soon as either stream exceeds the cap, so runaway prints cost
+        O(max_output_bytes) memory instead of buffering the whole output. Returns the decoded
+        stdout and stderr plus whether stdout was truncated.
+        """
+
+        async def _read(stream: asyncio.StreamReader) -> tuple[str, bool]:
+            buf = bytearray()
+            while chunk := await stream.read(65536):
+                buf += chunk
+                if len(buf) > self.max_output_bytes:
+                    with suppress(ProcessLookupError):
+                        process.kill()
+                    return buf[: self.max_output_bytes].decode(errors="replace") + "\n... (output truncated)", True
+            return buf.decode(errors="replace"), False
+
+        (stdout, stdout_truncated), (stderr, _) = await asyncio.gather(_read(process.stdout), _read(process.stderr))
+        await process.wait()
+        return stdout, stderr, stdout_truncated
 
     async def execute_code(self, code: str) -> str:
         """Execute Python code in sandbox with safety checks"""
@@ -254,33 +285,36 @@ except Exception as e:
     error_msg = f"Error: {{str(e)}}\\nTraceback:\\n{{traceback.format_exc()}}"
     print(error_msg)"""
 
-        with self._create_safe_environment() as (script_path, env, temp_dir):
+        async with self._create_safe_environment() as (script_path, env, temp_dir):
             # Write code to file
-            with open(script_path, "w") as f:
-                f.write(wrapped_code)
+            await asyncio.to_thread(_write_text, script_path, wrapped_code)
 
             try:
-                # Use subprocess to run code
-                process = subprocess.Popen(
-                    ["python3", script_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                # Use an asyncio subprocess so waiting on the code does not block the event loop
+                process = await asyncio.create_subprocess_exec(
+                    "python3",
+                    script_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                     env=env,
                     cwd=temp_dir,
-                    text=True,
                 )
 
                 # Set timeout
                 try:
-                    stdout, stderr = process.communicate(timeout=self.timeout)
+                    stdout, stderr, stdout_truncated = await asyncio.wait_for(
+                        self._communicate_capped(process), timeout=self.timeout
+                    )
 
-                    if process.returncode == 0:
+                    if process.returncode == 0 or stdout_truncated:
                         result = stdout.strip()
                     else:
                         result = f"Error: Process exited with code {process.returncode}\n{stderr}"
 
-                except subprocess.TimeoutExpired:
-                    process.kill()
+                except asyncio.TimeoutError:
+                    with suppress(ProcessLookupError):
+                        process.kill()
+                    await process.wait()
                     result = f"Error: Code execution timed out after {self.timeout} seconds"
 
             except Exception as e:
@@ -299,9 +333,13 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools = {}
+        self._tool_specs = None
         self.python_sandbox = PythonSandbox(
-            timeout=TOOL_CONFIGS["python_timeout"], memory_limit=TOOL_CONFIGS["python_memory_limit"]
+            timeout=TOOL_CONFIGS["python_timeout"],
+            memory_limit=TOOL_CONFIGS["python_memory_limit"],
+            max_output_bytes=TOOL_CONFIGS["python_max_output_bytes"],
         )
+        self._handlers = {"code_interpreter": self._execute_python}
         self._register_default_tools()
 
     def _register_default_tools(self):
@@ -326,21 +364,25 @@ class ToolRegistry:
     def register_tool(self, name: str, tool_spec: dict[str, Any]):
         """Register a new tool in the registry"""
         self.tools[name] = tool_spec
+        self._tool_specs = None
 
     def get_tool_specs(self) -> list[dict[str, Any]]:
-        """Get all tool specifications as a list"""
-        return list(self.tools.values())
+        """Get all tool specifications as a list (built once and shared; callers must not mutate it)"""
+        if self._tool_specs is None:
+            self._tool_specs = list(self.tools.values())
+        return self._tool_specs
 
     async def execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
         """Execute a tool call with the given arguments"""
         if tool_name not in self.tools:
             return f"Error: Tool '{tool_name}' not found"
 
+        handler = self._handlers.get(tool_name)
+        if handler is None:
+            return f"Error: Tool '{tool_name}' not implemented"
+
         async with SEMAPHORE:
-            if tool_name == "code_interpreter":
-                return await self._execute_python(arguments)
-            else:
-                return f"Error: Tool '{tool_name}' not implemented"
+            return await handler(arguments)
 
     async def _execute_python(self, arguments: dict[str, Any]) -> str:
         """Execute Python code using the sandbox"""
@@ -158,8 +158,10 @@ async def generate(args, sample: Sample, sampling_params) -> Sample:
     rollout_log_probs = [] if SEARCH_R1_CONFIGS["return_logprob"] else None
 
     for _turn_idx in range(SEARCH_R1_CONFIGS["max_turns"]):
+        # Send the accumulated token ids so only the newest turn is ever tokenized, instead of
+        # having the server re-tokenize the whole growing conversation text every turn.
         payload = {
-            "text": prompt_text + response,
+            "input_ids": prompt_tokens_ids + response_token_ids,
             "sampling_params": sampling_params,
         }
         # Add log probability collection if enabled
@@ -5,6 +5,7 @@ import re
 
 import aiohttp
 import chardet
+from search_session import get_session, make_resolver
 
 
 # --- Utilities ---
@@ -63,7 +64,7 @@ async def fetch(session: aiohttp.ClientSession, url: str, semaphore: asyncio.Sem
 async def fetch_all(urls: list[str], limit: int = 8) -> list[str]:
     semaphore = asyncio.Semaphore(limit)
     timeout = aiohttp.ClientTimeout(total=5)
-    connector = aiohttp.TCPConnector(limit_per_host=limit, force_close=True)
+    connector = aiohttp.TCPConnector(limit_per_host=limit, force_close=True, resolver=make_resolver())
 
     async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
         tasks = [fetch(session, url, semaphore) for url in urls]
@@ -93,27 +94,24 @@ def collect_context(snippet: str, doc: str) -> str:
 
 async def google_search(api_key, query, top_k=5, timeout: int = 60, proxy=None, snippet_only=False) -> list[dict]:
     timeout_obj = aiohttp.ClientTimeout(total=timeout)
-    session_kwargs = {}
-    if proxy:
-        session_kwargs["proxy"] = proxy
-    async with aiohttp.ClientSession(**session_kwargs) as session:
-        async with session.post(
-            "https://google.serper.dev/search",
-            json={
-                "q": query,
-                "num": top_k,
-                "gl": "us",
-                "hl": "en",
-            },
-            headers={
-                "Content-Type": "application/json",
-                "X-API-KEY": api_key,
-            },
-            timeout=timeout_obj,
-        ) as resp:
-            resp.raise_for_status()
-            response = await resp.json()
-            items = response.get("organic", [])
+    session = get_session(proxy)
+    async with session.post(
+        "https://google.serper.dev/search",
+        json={
+            "q": query,
+            "num": top_k,
+            "gl": "us",
+            "hl": "en",
+        },
+        headers={
+            "Content-Type": "application/json",
+            "X-API-KEY": api_key,
+        },
+        timeout=timeout_obj,
+    ) as resp:
+        resp.raise_for_status()
+        response = await resp.json()
+        items = response.get("organic", [])
 
     contexts = []
     if snippet_only:
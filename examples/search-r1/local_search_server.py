@@ -20,6 +20,7 @@ Usage:
 """
 
 import aiohttp
+from search_session import get_session
 
 
 async def local_search(
@@ -57,16 +58,13 @@ async def local_search(
 
     # Send async request to local retrieval server
     timeout_obj = aiohttp.ClientTimeout(total=timeout)
-    session_kwargs = {}
     # Note: proxy parameter is kept for API compatibility but typically not needed for local server
-    if proxy:
-        session_kwargs["proxy"] = proxy
+    session = get_session(proxy)
 
     try:
-        async with aiohttp.ClientSession(**session_kwargs) as session:
-            async with session.post(search_url, json=payload, timeout=timeout_obj) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
+        async with session.post(search_url, json=payload, timeout=timeout_obj) as resp:
+            resp.raise_for_status()
+            result = await resp.json()
     except Exception as e:
         print(f"Error calling local search engine at {search_url}: {e}")
         return []
@@ -0,0 +1,52 @@
+"""
+Shared aiohttp sessions for the search backends (google_search_server.py / local_search_server.py).
+"""
+
+import asyncio
+import atexit
+from contextlib import suppress
+
+import aiohttp
+
+try:
+    import aiodns  # noqa: F401  # enables aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
+
+def make_resolver():
+    # c-ares resolves without occupying the default thread pool; fall back to getaddrinfo in threads.
+    return aiohttp.AsyncResolver() if aiodns is not None else aiohttp.ThreadedResolver()
+
+
+# One long-lived session per proxy setting, so repeated searches reuse pooled keep-alive connections.
+# Each entry remembers the event loop it was created on so it can be closed there at exit.
+_SESSIONS: dict[str | None, tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+
+
+def get_session(proxy: str | None) -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session, session_loop = _SESSIONS.get(proxy, (None, None))
+    if session is None or session.closed or session_loop is not loop:
+        session_kwargs = {}
+        if proxy:
+            session_kwargs["proxy"] = proxy
+        # limit=0: concurrency is already bounded by the caller's search semaphore
+        connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300, resolver=make_resolver())
+        session = aiohttp.ClientSession(connector=connector, **session_kwargs)
+        _SESSIONS[proxy] = (session, loop)
+    return session
+
+
+@atexit.register
+def _close_sessions():
+    for session, loop in _SESSIONS.values():
+        if session.closed or loop.is_closed():
+            continue
+        with suppress(Exception):
+            if loop.is_running():
+                # Rollouts run on miles' background loop thread, which is still alive while atexit hooks run
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(session.close())
+    _SESSIONS.clear()
@@ -81,7 +81,13 @@ def _add_arguments(parser: argparse.ArgumentParser):
     parser.add_argument("--generate-max-turns", type=int, default=16)
     parser.add_argument("--generate-tool-specs-path", type=str)
     parser.add_argument("--generate-tool-call-parser", type=str)
-    parser.add_argument("--generate-execute-tool-function-path", type=str)
+    parser.add_argument(
+        "--generate-execute-tool-function-path",
+        type=str,
+        help="Async function (name, params) -> str that executes one tool call. All tool calls from one "
+        "assistant turn are executed concurrently, so it must be safe to run concurrently with itself "
+        "(e.g. guard any per-sample shell or env session with a lock).",
+    )
     parser.add_argument("--generate-multi-samples", action="store_true")
 
 
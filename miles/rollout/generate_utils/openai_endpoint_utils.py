@@ -6,6 +6,7 @@ import asyncio
 import logging
 from argparse import Namespace
 from copy import deepcopy
+from dataclasses import replace
 
 from miles.rollout.generate_utils.generate_endpoint_utils import get_rollout_topk_from_response
 from miles.rollout.session.session_types import GetSessionResponse, SessionRecord
@@ -173,7 +174,9 @@ def _compute_sample_from_openai_record(
     output_token_ids = [item[1] for item in choice["meta_info"]["output_token_logprobs"]]
     output_log_probs = [item[0] for item in choice["meta_info"]["output_token_logprobs"]]
 
-    sample = deepcopy(input_sample)
+    # tokens, rollout_log_probs and loss_mask are all reassigned below, so blank them out before the deepcopy
+    # instead of copying the prompt's (possibly long) lists only to throw the copies away.
+    sample = deepcopy(replace(input_sample, tokens=[], rollout_log_probs=None, loss_mask=None))
     request_input_ids = record.request.get("input_ids")
     if request_input_ids is not None:
         assert (
@@ -2,25 +2,43 @@
 Utils to handle tool calls.
 """
 
+import asyncio
 import json
 import uuid
 from collections.abc import Callable
 from typing import Any
 
 from openai.types.chat import ChatCompletionMessageToolCall
-from pydantic import TypeAdapter
-from sglang.srt.entrypoints.openai.protocol import Tool
 from sglang.srt.function_call.core_types import ToolCallItem
 from sglang.srt.function_call.function_call_parser import FunctionCallParser
 
+from miles.utils.tool_spec_utils import TOOLS_ADAPTER
 from miles.utils.types import Sample
 
 _DUMMY_USER = {"role": "user", "content": "dummy"}
+_TOOL_CALL_PARSER_CACHE_SIZE = 16
+_TOOL_CALL_PARSER_CACHE: dict[tuple[str, str], FunctionCallParser] = {}
 
 
 def create_tool_call_parser(tool_specs, tool_call_parser):
+    # multi_turn calls this once per sample with the same specs, so reuse the built parser. Callers here only use
+    # parse_non_stream; sharing an instance assumes the detector keeps no state across non-streaming calls.
+    try:
+        key = (json.dumps(tool_specs), tool_call_parser)
+    except TypeError:  # not plain JSON (e.g. already-built Tool models); build without caching
+        return _build_tool_call_parser(tool_specs, tool_call_parser)
+
+    parser = _TOOL_CALL_PARSER_CACHE.get(key)
+    if parser is None:
+        if len(_TOOL_CALL_PARSER_CACHE) >= _TOOL_CALL_PARSER_CACHE_SIZE:
+            _TOOL_CALL_PARSER_CACHE.pop(next(iter(_TOOL_CALL_PARSER_CACHE)))
+        parser = _TOOL_CALL_PARSER_CACHE[key] = _build_tool_call_parser(tool_specs, tool_call_parser)
+    return parser
+
+
+def _build_tool_call_parser(tool_specs, tool_call_parser) -> FunctionCallParser:
     return FunctionCallParser(
-        tools=TypeAdapter(list[Tool]).validate_python(tool_specs),
+        tools=TOOLS_ADAPTER.validate_python(tool_specs),
         tool_call_parser=tool_call_parser,
     )
 
@@ -29,10 +47,16 @@ async def execute_tool_calls(
     tool_calls: list[ToolCallItem | ChatCompletionMessageToolCall],
     execute_one: Callable,
 ) -> list[dict[str, Any]]:
-    tool_messages = []
-    for call in tool_calls:
-        tool_messages.append(await _execute_tool_call(call, execute_one))
-    return tool_messages
+    # Tool calls within one assistant turn are independent, so overlap them; gather keeps the call order.
+    tasks = [asyncio.create_task(_execute_tool_call(call, execute_one)) for call in tool_calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Don't leave the remaining calls running detached once one of them has failed.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def _execute_tool_call(
@@ -1,5 +1,7 @@
 import asyncio
+import atexit
 import random
+from contextlib import suppress
 
 import aiohttp
 
@@ -14,17 +16,49 @@ from .math_utils import extract_answer as extract_boxed_answer
 from .math_utils import grade_answer_verl
 
 
+# Shared RM session plus the event loop it was created on; rollouts reuse it across samples, while a
+# different loop (asyncio.run in replay tools, per-test loops) gets a fresh one.
+_remote_rm_session: tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop] | None = None
+
+
+def _get_remote_rm_session() -> aiohttp.ClientSession:
+    global _remote_rm_session
+    loop = asyncio.get_running_loop()
+    if _remote_rm_session is not None:
+        session, session_loop = _remote_rm_session
+        if not session.closed and session_loop is loop:
+            return session
+    # limit=0: keep the previous uncapped behaviour; concurrency is bounded by the rollout itself.
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+    _remote_rm_session = (session, loop)
+    return session
+
+
+@atexit.register
+def _close_remote_rm_session():
+    if _remote_rm_session is None:
+        return
+    session, loop = _remote_rm_session
+    if session.closed or loop.is_closed():
+        return
+    with suppress(Exception):
+        if loop.is_running():
+            # The rollout loop runs on a daemon thread that is still alive while atexit hooks run
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+        else:
+            loop.run_until_complete(session.close())
+
+
 async def remote_rm(args, sample: Sample):
     payload = {
         "prompt": sample.prompt,
         "response": sample.response,
         "label": sample.label,
     }
-    session_kwargs = {}
-    async with aiohttp.ClientSession(**session_kwargs) as session:
-        async with session.post(args.rm_url, json=payload) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    session = _get_remote_rm_session()
+    async with session.post(args.rm_url, json=payload) as resp:
+        resp.raise_for_status()
+        return await resp.json()
 
 
 async def async_rm(args, sample: Sample, **kwargs):
@@ -83,6 +83,9 @@ class SessionServer:
         status_code = result["status_code"]
         headers = result["headers"]
         content_type = headers.get("content-type", "")
+        if content_type.startswith("application/json"):
+            # Already JSON from the backend: forward the bytes instead of a json.loads + JSONResponse re-encode.
+            return Response(content=content, status_code=status_code, headers=headers, media_type=content_type)
         try:
             data = json.loads(content)
             return JSONResponse(content=data, status_code=status_code, headers=headers)
@@ -21,10 +21,10 @@ from typing import Any
 
 from huggingface_hub import hf_hub_download
 from jinja2 import TemplateError
-from pydantic import TypeAdapter
-from sglang.srt.entrypoints.openai.protocol import Tool
 from transformers.utils.chat_template_utils import render_jinja_template
 
+from miles.utils.tool_spec_utils import TOOLS_ADAPTER
+
 
 def load_hf_chat_template(model_id: str) -> str:
     """Load an original chat template from HuggingFace (cached locally).
@@ -84,7 +84,7 @@ def extract_tool_dicts(tools: list[dict] | None) -> list[dict] | None:
         return None
 
     wrapped = [t if isinstance(t, dict) and "function" in t else {"type": "function", "function": t} for t in tools]
-    validated = TypeAdapter(list[Tool]).validate_python(wrapped)
+    validated = TOOLS_ADAPTER.validate_python(wrapped)
     return [tool.model_dump() for tool in validated]
 
 
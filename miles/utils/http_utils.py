@@ -10,11 +10,27 @@ import time
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the stdlib decoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 MILES_HOST_IP_ENV = "MILES_HOST_IP"
 
 
+def _decode_json(response: httpx.Response):
+    # /generate responses carry per-token logprob lists, so decoding is a hot path
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. rejects NaN/Infinity); let response.json() decide
+            pass
+    return response.json()
+
+
 def find_available_port(base_port: int):
     port = base_port + random.randint(100, 1000)
     while True:
@@ -196,7 +212,7 @@ async def _post(client, url, payload, max_retries=60, action="post", headers=Non
                 response = await getattr(client, action)(url, json=payload or {}, headers=headers)
             response.raise_for_status()
             try:
-                output = response.json()
+                output = _decode_json(response)
             except json.JSONDecodeError:
                 output = response.text
         except Exception as e:
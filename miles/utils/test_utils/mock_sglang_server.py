@@ -8,10 +8,8 @@ from dataclasses import asdict, dataclass
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from pydantic import TypeAdapter
-from sglang.srt.entrypoints.openai.protocol import Tool
-from sglang.srt.function_call.function_call_parser import FunctionCallParser
 
+from miles.rollout.generate_utils.tool_call_utils import create_tool_call_parser
 from miles.utils.http_utils import find_available_port
 from miles.utils.processing_utils import load_tokenizer
 from miles.utils.test_utils.uvicorn_thread_server import UvicornThreadServer
@@ -167,10 +165,7 @@ class MockSGLangServer:
         finish_reason = process_result.finish_reason
         tool_calls = None
         if tools and finish_reason == "stop":
-            parser = FunctionCallParser(
-                tools=TypeAdapter(list[Tool]).validate_python(tools),
-                tool_call_parser="qwen25",
-            )
+            parser = create_tool_call_parser(tools, "qwen25")
             message_content, parsed_calls = parser.parse_non_stream(process_result.text)
             if parsed_calls:
                 finish_reason = "tool_calls"
@@ -213,11 +213,10 @@ class TwoTurnStub:
             TwoTurnStub.SECOND_PROMPT: TwoTurnStub.SECOND_RESPONSE,
         }
 
-        for expect_prompt, response in prompt_response_pairs.items():
-            if prompt == expect_prompt:
-                return ProcessResult(text=response, finish_reason="stop")
-
-        raise ValueError(f"Unexpected {prompt=}")
+        response = prompt_response_pairs.get(prompt)
+        if response is None:
+            raise ValueError(f"Unexpected {prompt=}")
+        return ProcessResult(text=response, finish_reason="stop")
 
 
 class ThreeTurnStub:
@@ -329,8 +328,7 @@ class ThreeTurnStub:
             ThreeTurnStub.THIRD_PROMPT: ThreeTurnStub.THIRD_RESPONSE,
         }
 
-        for expect_prompt, response in prompt_response_pairs.items():
-            if prompt == expect_prompt:
-                return ProcessResult(text=response, finish_reason="stop")
-
-        raise ValueError(f"Unexpected {prompt=}")
+        response = prompt_response_pairs.get(prompt)
+        if response is None:
+            raise ValueError(f"Unexpected {prompt=}")
+        return ProcessResult(text=response, finish_reason="stop")
@@ -1006,9 +1006,9 @@ def build_process_fn(
         prompt_response_map[prompt_str] = turn.response_text
 
     def process_fn(prompt: str) -> ProcessResult:
-        for expected_prompt, response_text in prompt_response_map.items():
-            if prompt == expected_prompt:
-                return ProcessResult(text=response_text, finish_reason="stop")
+        response_text = prompt_response_map.get(prompt)
+        if response_text is not None:
+            return ProcessResult(text=response_text, finish_reason="stop")
         raise ValueError(
             f"Unexpected prompt (length={len(prompt)}).\n"
             f"Known prompts: {[len(p) for p in prompt_response_map]}\n"
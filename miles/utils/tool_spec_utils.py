@@ -0,0 +1,5 @@
+from pydantic import TypeAdapter
+from sglang.srt.entrypoints.openai.protocol import Tool
+
+# Shared list[Tool] validator; building a TypeAdapter compiles a pydantic schema, so do it once
+TOOLS_ADAPTER = TypeAdapter(list[Tool])
@@ -1,7 +1,18 @@
+import asyncio
+
 import pytest
+from sglang.srt.function_call.core_types import ToolCallItem
 
-from miles.rollout.generate_utils.tool_call_utils import _DUMMY_USER, _build_dummy_assistant, tokenize_tool_responses
+from miles.rollout.generate_utils.tool_call_utils import (
+    _DUMMY_USER,
+    _build_dummy_assistant,
+    create_tool_call_parser,
+    execute_tool_calls,
+    tokenize_tool_responses,
+)
 from miles.utils.processing_utils import load_tokenizer
+from miles.utils.test_utils.mock_tools import SAMPLE_TOOLS
+from miles.utils.tool_spec_utils import TOOLS_ADAPTER
 
 TOOL_CALL_TEST_MODELS = [
     "Qwen/Qwen2.5-0.5B-Instruct",
@@ -104,3 +115,65 @@ class TestTokenizeToolResponses:
         )
         text_without = tokenizer.apply_chat_template(base_messages, tokenize=False, add_generation_prompt=False)
         return text_with[len(text_without) :]
+
+
+class TestExecuteToolCalls:
+    async def test_runs_concurrently_and_preserves_order(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute_one(name: str, params: dict) -> str:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later calls finish first, so ordering must come from the input, not completion time.
+            await asyncio.sleep(0.01 * params["delay"])
+            in_flight -= 1
+            return name
+
+        tool_calls = [
+            ToolCallItem(tool_index=i, name=f"tool_{i}", parameters=f'{{"delay": {3 - i}}}') for i in range(3)
+        ]
+        tool_messages = await execute_tool_calls(tool_calls, execute_one)
+
+        assert [m["content"] for m in tool_messages] == ["tool_0", "tool_1", "tool_2"]
+        assert [m["name"] for m in tool_messages] == ["tool_0", "tool_1", "tool_2"]
+        assert max_in_flight == 3
+
+    async def test_cancels_remaining_calls_on_failure(self):
+        cancelled = []
+
+        async def execute_one(name: str, params: dict) -> str:
+            if name == "fail":
+                raise RuntimeError("tool failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return name
+
+        tool_calls = [
+            ToolCallItem(tool_index=0, name="slow_0", parameters="{}"),
+            ToolCallItem(tool_index=1, name="fail", parameters="{}"),
+            ToolCallItem(tool_index=2, name="slow_2", parameters="{}"),
+        ]
+        with pytest.raises(RuntimeError, match="tool failed"):
+            await execute_tool_calls(tool_calls, execute_one)
+
+        assert sorted(cancelled) == ["slow_0", "slow_2"]
+
+
+class TestCreateToolCallParser:
+    def test_reuses_parser_for_same_specs(self):
+        parser = create_tool_call_parser(SAMPLE_TOOLS, "qwen25")
+
+        assert create_tool_call_parser(list(SAMPLE_TOOLS), "qwen25") is parser
+        assert create_tool_call_parser(SAMPLE_TOOLS[:1], "qwen25") is not parser
+        assert parser.parse_non_stream("The weather is sunny today.") == ("The weather is sunny today.", [])
+
+    def test_accepts_tool_models(self):
+        tools = TOOLS_ADAPTER.validate_python(SAMPLE_TOOLS)
+        parser = create_tool_call_parser(tools, "qwen25")
+
+        assert parser.parse_non_stream("The weather is sunny today.") == ("The weather is sunny today.", [])
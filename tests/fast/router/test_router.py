@@ -9,6 +9,9 @@ from miles.utils.http_utils import find_available_port
 from miles.utils.test_utils.mock_sglang_server import MockSGLangServer, default_process_fn
 from miles.utils.test_utils.uvicorn_thread_server import UvicornThreadServer
 
+# Shared keep-alive session so sequential calls to the same server don't each open a new connection
+HTTP = requests.Session()
+
 
 def make_router_args(router_port: int, **overrides) -> Namespace:
     defaults = dict(
@@ -45,6 +48,12 @@ class RouterEnv:
         return self.server.url
 
 
+@pytest.fixture(scope="module", autouse=True)
+def close_http_session():
+    yield
+    HTTP.close()
+
+
 @pytest.fixture
 def router_env():
     args = make_router_args(find_available_port(20000))
@@ -91,7 +100,7 @@ def router_factory():
 class TestWorkerManagement:
     def test_add_worker_via_query_param(self, router_env: RouterEnv):
         worker_url = "http://127.0.0.1:30001"
-        r = requests.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0)
+        r = HTTP.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0)
         r.raise_for_status()
 
         assert r.json()["status"] == "success"
@@ -100,7 +109,7 @@ class TestWorkerManagement:
 
     def test_add_worker_via_body(self, router_env: RouterEnv):
         worker_url = "http://127.0.0.1:30002"
-        r = requests.post(f"{router_env.url}/add_worker", json={"url": worker_url}, timeout=5.0)
+        r = HTTP.post(f"{router_env.url}/add_worker", json={"url": worker_url}, timeout=5.0)
         r.raise_for_status()
 
         assert r.json()["status"] == "success"
@@ -108,23 +117,23 @@ class TestWorkerManagement:
 
     def test_add_worker_duplicate(self, router_env: RouterEnv):
         worker_url = "http://127.0.0.1:30003"
-        requests.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0).raise_for_status()
-        requests.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0).raise_for_status()
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0).raise_for_status()
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": worker_url}, timeout=5.0).raise_for_status()
 
         assert len(router_env.router.worker_request_counts) == 1
         assert worker_url in router_env.router.worker_request_counts
 
     def test_add_worker_missing_url(self, router_env: RouterEnv):
-        r = requests.post(f"{router_env.url}/add_worker", json={}, timeout=5.0)
+        r = HTTP.post(f"{router_env.url}/add_worker", json={}, timeout=5.0)
         assert r.status_code == 400
         assert "error" in r.json()
 
     def test_list_workers(self, router_env: RouterEnv):
         worker_urls = ["http://127.0.0.1:30001", "http://127.0.0.1:30002"]
         for url in worker_urls:
-            requests.post(f"{router_env.url}/add_worker", params={"url": url}, timeout=5.0)
+            HTTP.post(f"{router_env.url}/add_worker", params={"url": url}, timeout=5.0)
 
-        r = requests.get(f"{router_env.url}/list_workers", timeout=5.0)
+        r = HTTP.get(f"{router_env.url}/list_workers", timeout=5.0)
         r.raise_for_status()
         assert set(r.json()["urls"]) == set(worker_urls)
 
@@ -173,10 +182,10 @@ class TestHealthCheck:
 
 class TestProxyIntegration:
     def test_proxy_forwards_request(self, router_env: RouterEnv, mock_worker: MockSGLangServer):
-        requests.post(f"{router_env.url}/add_worker", params={"url": mock_worker.url}, timeout=5.0).raise_for_status()
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": mock_worker.url}, timeout=5.0).raise_for_status()
 
         payload = {"input_ids": [1, 2, 3], "return_logprob": True}
-        r = requests.post(f"{router_env.url}/generate", json=payload, timeout=10.0)
+        r = HTTP.post(f"{router_env.url}/generate", json=payload, timeout=10.0)
         r.raise_for_status()
 
         assert "text" in r.json()
@@ -185,20 +194,20 @@ class TestProxyIntegration:
 
     def test_proxy_multi_worker(self, router_env: RouterEnv, mock_worker_factory):
         worker1, worker2 = mock_worker_factory(), mock_worker_factory()
-        requests.post(f"{router_env.url}/add_worker", params={"url": worker1.url}, timeout=5.0)
-        requests.post(f"{router_env.url}/add_worker", params={"url": worker2.url}, timeout=5.0)
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": worker1.url}, timeout=5.0)
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": worker2.url}, timeout=5.0)
 
         payload = {"input_ids": [1, 2, 3], "return_logprob": True}
         for _ in range(4):
-            requests.post(f"{router_env.url}/generate", json=payload, timeout=10.0).raise_for_status()
+            HTTP.post(f"{router_env.url}/generate", json=payload, timeout=10.0).raise_for_status()
 
         all_requests = worker1.request_log + worker2.request_log
         assert len(all_requests) == 4
         assert all(req == payload for req in all_requests)
 
     def test_proxy_health_endpoint(self, router_env: RouterEnv, mock_worker: MockSGLangServer):
-        requests.post(f"{router_env.url}/add_worker", params={"url": mock_worker.url}, timeout=5.0)
+        HTTP.post(f"{router_env.url}/add_worker", params={"url": mock_worker.url}, timeout=5.0)
 
-        r = requests.get(f"{router_env.url}/health", timeout=5.0)
+        r = HTTP.get(f"{router_env.url}/health", timeout=5.0)
         r.raise_for_status()
         assert r.json()["status"] == "ok"
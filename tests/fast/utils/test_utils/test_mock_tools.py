@@ -1,12 +1,13 @@
 import asyncio
 
 import pytest
-from pydantic import TypeAdapter
-from sglang.srt.entrypoints.openai.protocol import Tool
 from sglang.srt.function_call.core_types import ToolCallItem
 from sglang.srt.function_call.function_call_parser import FunctionCallParser
 
 from miles.utils.test_utils.mock_tools import SAMPLE_TOOLS, TwoTurnStub, execute_tool_call
+from miles.utils.tool_spec_utils import TOOLS_ADAPTER
+
+VALIDATED_SAMPLE_TOOLS = TOOLS_ADAPTER.validate_python(SAMPLE_TOOLS)
 
 
 class TestExecuteToolCall:
@@ -106,6 +107,5 @@ class TestSGLangFunctionCallParser:
         ],
     )
     def test_parse_non_stream(self, model_output, expected):
-        tools = TypeAdapter(list[Tool]).validate_python(SAMPLE_TOOLS)
-        parser = FunctionCallParser(tools=tools, tool_call_parser="qwen25")
+        parser = FunctionCallParser(tools=VALIDATED_SAMPLE_TOOLS, tool_call_parser="qwen25")
         assert parser.parse_non_stream(model_output) == expected